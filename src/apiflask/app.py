@@ -33,6 +33,7 @@ from werkzeug.exceptions import HTTPException as WerkzeugHTTPException
 
 from .exceptions import HTTPError
 from .exceptions import _bad_schema_message
+from .helpers import _dumps_yaml
 from .helpers import get_reason_phrase
 from .route import route_patch
 from .schemas import Schema
@@ -363,6 +364,12 @@ class APIFlask(APIScaffold, Flask):
 
         self.spec_plugins: list[BasePlugin] = spec_plugins or []
         self._spec: dict | str | None = None
+        # the serialized JSON spec response body, reset when the spec is regenerated
+        self._spec_json: bytes | None = None
+        # the base response schema class and its cached instance
+        self._base_response_schema: tuple[type[Schema], Schema] | None = None
+        # the serialization options and content of the synced local spec
+        self._local_spec: tuple[tuple[str, int | None], str] | None = None
         self._auth_blueprints: dict[str, t.Dict[str, t.Any]] = {}
 
         self._register_openapi_blueprint()
@@ -538,9 +545,13 @@ class APIFlask(APIScaffold, Flask):
             @self._apply_decorators(config_name='SPEC_DECORATORS')
             def spec():
                 if self.config['SPEC_FORMAT'] == 'json':
-                    response = jsonify(self._get_spec('json'))
-                    response.mimetype = self.config['JSON_SPEC_MIMETYPE']
-                    return response
+                    spec_dict = self._get_spec('json')
+                    # serialize the spec again only when it was regenerated
+                    if self._spec_json is None:
+                        self._spec_json = jsonify(spec_dict).get_data()
+                    return self.response_class(
+                        self._spec_json, mimetype=self.config['JSON_SPEC_MIMETYPE']
+                    )
                 return (
                     self._get_spec('yaml'),
                     200,
@@ -617,10 +628,17 @@ class APIFlask(APIScaffold, Flask):
 
         - Add the `SPEC_PROCESSOR_PASS_OBJECT` config to control the argument type
           when calling the spec processor.
+
+        *Version changed: 2.5.0*
+
+        - Only write the local spec file when it's missing or its content differs.
         """
         if spec_format is None:
             spec_format = self.config['SPEC_FORMAT']
-        if self._spec is None or force_update:
+        updated = self._spec is None or force_update
+        if updated:
+            self._spec_json = None
+            self._local_spec = None
             spec_object: APISpec = self._generate_spec()
             if self.spec_callback:
                 if self.config['SPEC_PROCESSOR_PASS_OBJECT']:
@@ -632,23 +650,46 @@ class APIFlask(APIScaffold, Flask):
             else:
                 self._spec = spec_object.to_dict()
             if spec_format in ['yml', 'yaml']:
-                from apispec.yaml_utils import dict_to_yaml
-
-                self._spec = dict_to_yaml(self._spec)  # type: ignore
+                self._spec = _dumps_yaml(self._spec)  # type: ignore
         # sync local spec
         if self.config['SYNC_LOCAL_SPEC']:
             spec_path = self.config['LOCAL_SPEC_PATH']
             if spec_path is None:
                 raise TypeError('The spec path (LOCAL_SPEC_PATH) should be a valid path string.')
-            spec: str
-            if spec_format == 'json':
-                spec = json.dumps(self._spec, indent=self.config['LOCAL_SPEC_JSON_INDENT'])
-            else:
-                spec = str(self._spec)
-            with open(spec_path, 'w') as f:
-                f.write(spec)
+            indent = self.config['LOCAL_SPEC_JSON_INDENT'] or None
+            options = (spec_format, indent)
+            # serialize the spec again only when it or the options changed
+            if self._local_spec is None or self._local_spec[0] != options:
+                spec: str
+                if spec_format == 'json':
+                    spec = json.dumps(self._spec, indent=indent)
+                else:
+                    spec = str(self._spec)
+                self._local_spec = (options, spec)
+            # write the file only when it's missing or its content differs
+            try:
+                with open(spec_path) as f:
+                    local_spec: str | None = f.read()
+            except OSError:
+                local_spec = None
+            if local_spec != self._local_spec[1]:
+                with open(spec_path, 'w') as f:
+                    f.write(self._local_spec[1])
         return self._spec  # type: ignore
 
+    def _get_base_response_schema(self) -> Schema:
+        """Get the instance of the `BASE_RESPONSE_SCHEMA` config.
+
+        The instance is cached and will be created again when the config
+        value is replaced.
+
+        *Version added: 2.5.0*
+        """
+        base_schema: type[Schema] = self.config['BASE_RESPONSE_SCHEMA']
+        if self._base_response_schema is None or self._base_response_schema[0] is not base_schema:
+            self._base_response_schema = (base_schema, base_schema())
+        return self._base_response_schema[1]
+
     def spec_processor(self, f: SpecCallbackType) -> SpecCallbackType:
         """A decorator to register a spec handler callback function.
 
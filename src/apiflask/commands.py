@@ -1,7 +1,65 @@
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+
 import click
 from flask import current_app
 from flask import json
 from flask.cli import with_appcontext
+from flask.json.provider import DefaultJSONProvider
+
+from .helpers import _dumps_yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _is_plain_json(obj: t.Any) -> bool:
+    """Check if the object only contains JSON types that orjson and the stdlib
+    encoder serialize the same way.
+
+    Floats are excluded since orjson writes exponents (`1e16` vs `1e+16`) and
+    non-finite values (`null` vs `NaN`) differently.
+    """
+    if obj is None or isinstance(obj, (str, int)):
+        return True
+    if isinstance(obj, dict):
+        return all(_is_plain_json(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_is_plain_json(item) for item in obj)
+    return False
+
+
+def _dumps_spec(spec: t.Any, indent: int | None) -> bytes:
+    """Serialize the spec dict to UTF-8 encoded JSON.
+
+    Use orjson when it's installed and the output is identical to the stdlib
+    encoder: 2-space indentation with the default JSON provider, and a spec
+    that only contains plain JSON types without floats. Otherwise fall back
+    to `flask.json.dumps`.
+    """
+    provider = current_app.json
+    if (
+        orjson is not None
+        and indent == 2
+        and type(provider) is DefaultJSONProvider
+        and _is_plain_json(spec)
+    ):
+        option = orjson.OPT_INDENT_2
+        if provider.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            data = orjson.dumps(spec, option=option)
+        except TypeError:
+            # e.g. integers out of the 64-bit range or non-string keys
+            pass
+        else:
+            if data.isascii() or not provider.ensure_ascii:
+                return data
+    return json.dumps(spec, indent=indent).encode()
 
 
 @click.command('spec', short_help='Show the OpenAPI spec.')
@@ -14,7 +72,7 @@ from flask.cli import with_appcontext
 @click.option(
     '--output',
     '-o',
-    type=click.Path(),
+    type=click.Path(dir_okay=False, writable=True),
     help='The file path to the spec file, defaults to LOCAL_SPEC_PATH config.',
 )
 @click.option(
@@ -37,18 +95,27 @@ def spec_command(format, output, indent, quiet):
     spec_format = format or current_app.config['SPEC_FORMAT']
     spec = current_app._get_spec(spec_format)
     output_path = output or current_app.config['LOCAL_SPEC_PATH']
+    # nothing to write, skip the serialization
+    if quiet and not output_path:
+        return
     if indent is None:
         indent = current_app.config['LOCAL_SPEC_JSON_INDENT']
     json_indent = None if indent == 0 else indent
 
     if spec_format == 'json':
-        spec = json.dumps(spec, indent=json_indent)
+        data = _dumps_spec(spec, json_indent)
+    elif isinstance(spec, str):
+        data = spec.encode()
+    else:
+        # the spec was cached as a dict by an earlier JSON spec call
+        data = _dumps_yaml(spec).encode()
+    # append the trailing newline once so each target gets a single write
+    data += b'\n'
 
     # output to stdout
     if not quiet:
-        click.echo(spec)
+        click.echo(data, nl=False)
 
     # output to local file
     if output_path:
-        with open(output_path, 'w') as f:
-            click.echo(spec, file=f)
+        Path(output_path).write_bytes(data)
@@ -107,3 +107,14 @@ def pagination_builder(pagination: PaginationType, **kwargs: t.Any) -> dict:
         'last': get_page_url(pagination.pages),
         'current': get_page_url(pagination.page),
     }
+
+
+def _dumps_yaml(spec: dict) -> str:
+    """Serialize the spec dict to YAML, use the libyaml based emitter when
+    PyYAML was built with it.
+    """
+    import yaml
+    from apispec.yaml_utils import dict_to_yaml
+
+    dumper = getattr(yaml, 'CDumper', yaml.Dumper)
+    return dict_to_yaml(spec, {'Dumper': dumper})
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from types import MappingProxyType
 
 from .security import HTTPBasicAuth
 from .security import HTTPTokenAuth
@@ -19,16 +20,20 @@ default_bypassed_endpoints: list[str] = [
     '_debug_toolbar.static',  # Flask-DebugToolbar
 ]
 
-default_response = {
-    'schema': {},
-    'status_code': 200,
-    'description': None,
-    'example': None,
-    'examples': None,
-    'links': None,
-    'content_type': 'application/json',
-    'headers': None,
-}
+# shared by every bare view, only the top-level mapping is read-only, the nested
+# `schema` dict must not be mutated either
+default_response: t.Mapping[str, t.Any] = MappingProxyType(
+    {
+        'schema': {},
+        'status_code': 200,
+        'description': None,
+        'example': None,
+        'examples': None,
+        'links': None,
+        'content_type': 'application/json',
+        'headers': None,
+    }
+)
 
 
 def get_tag(blueprint: APIBlueprint, blueprint_name: str) -> dict[str, t.Any]:
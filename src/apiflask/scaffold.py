@@ -7,10 +7,13 @@ from functools import wraps
 
 from flask import current_app
 from flask import jsonify
+from flask import Request
 from flask import request as flask_request
 from flask import Response
+from marshmallow import missing
 from marshmallow import ValidationError as MarshmallowValidationError
 from webargs.flaskparser import FlaskParser as BaseFlaskParser
+from webargs.flaskparser import is_json_request
 from webargs.multidictproxy import MultiDictProxy
 
 from .exceptions import _ValidationError
@@ -58,6 +61,13 @@ class FlaskParser(BaseFlaskParser):
         # Now using the refactored _ValidationError that encapsulates the logic
         raise _ValidationError(error.messages, error_status_code, error_headers)
 
+    def _raw_load_json(self, req: Request) -> t.Any:
+        # webargs treats an empty JSON body as missing after failing to decode it,
+        # return it directly to skip the decode and the exception handling
+        if is_json_request(req) and not req.get_data(cache=True):
+            return missing
+        return super()._raw_load_json(req)
+
     def load_location_data(self, schema: Schema, location: str) -> t.Any:
         """
         Expose the internal `_load_location_data` method to support loading data without validation
@@ -516,6 +526,8 @@ class APIScaffold:
                     'headers': headers,
                 },
             )
+            # the schema is fixed for this view, so check it once instead of per response
+            is_file_schema = isinstance(schema, FileSchema)
 
             def _jsonify(
                 obj: t.Any,
@@ -524,7 +536,7 @@ class APIScaffold:
                 **kwargs: t.Any,
             ) -> Response:  # pragma: no cover
                 """From Flask-Marshmallow, see the NOTICE file for license information."""
-                if isinstance(schema, FileSchema):
+                if is_file_schema:
                     return obj  # type: ignore
                 if many is _sentinel:
                     many = schema.many  # type: ignore
@@ -549,7 +561,7 @@ class APIScaffold:
                             schema.dump(getattr(obj, data_key), many=many),  # type: ignore
                         )
 
-                    data = base_schema().dump(obj)  # type: ignore
+                    data = current_app._get_base_response_schema().dump(obj)  # type: ignore
                 else:
                     data = schema.dump(obj, many=many)  # type: ignore
                 return jsonify(data, *args, **kwargs)
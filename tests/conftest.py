@@ -1,11 +1,12 @@
 import os
 
 import pytest
+from openapi_spec_validator import OpenAPIV30SpecValidator
+from openapi_spec_validator import OpenAPIV31SpecValidator
 
 from apiflask import APIFlask
 from contextlib import contextmanager
 import sys
-from pathlib import Path
 
 
 @pytest.fixture
@@ -21,9 +22,34 @@ def client(app):
 
 @pytest.fixture
 def cli_runner(app):
+    # output the compact JSON spec to keep the spec command tests fast, tests
+    # for the default indentation build their own runner
+    app.config['LOCAL_SPEC_JSON_INDENT'] = 0
     return app.test_cli_runner()
 
 
+@pytest.fixture(scope='module')
+def spec_cli_runner():
+    # shared by tests that only vary the command arguments and never
+    # touch the app, so the app and runner are built once per module
+    app = APIFlask(__name__)
+    app.config['LOCAL_SPEC_JSON_INDENT'] = 0
+    return app.test_cli_runner()
+
+
+@pytest.fixture(scope='session')
+def spec_validator():
+    # pick the validator class from the spec's major.minor version instead of
+    # letting `openapi_spec_validator.validate` detect it, a new validator is
+    # still built for each spec
+    validators = {'3.0': OpenAPIV30SpecValidator, '3.1': OpenAPIV31SpecValidator}
+
+    def get_validator(spec):
+        return validators[spec['openapi'][:3]](spec)
+
+    return get_validator
+
+
 @pytest.fixture
 def test_apps(monkeypatch):
     monkeypatch.syspath_prepend(
@@ -75,6 +101,15 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_marker)
 
 
+_IMPL_MODULES = ('apiflask.settings', 'apiflask.scaffold')
+
+
+def _clear_impl_modules():
+    """Drop the implementation-dependent modules so they are re-imported."""
+    for module in _IMPL_MODULES:
+        sys.modules.pop(module, None)
+
+
 @pytest.fixture(scope="session")
 def implementation_type(request):
     """Fixture that provides the current implementation type."""
@@ -94,14 +129,7 @@ def set_implementation(implementation_type):
     os.environ['APIFLASK_USE_SCHEMA_IMPL'] = 'true' if use_schema else 'false'
 
     # Clear module cache to ensure fresh imports
-    import sys
-    modules_to_clear = [
-        'apiflask.settings',
-        'apiflask.scaffold',
-    ]
-    for module in modules_to_clear:
-        if module in sys.modules:
-            del sys.modules[module]
+    _clear_impl_modules()
 
     yield implementation_type
 
@@ -118,15 +146,7 @@ def both_implementations(request):
     original = os.environ.get('APIFLASK_USE_SCHEMA_IMPL', 'true')
     os.environ['APIFLASK_USE_SCHEMA_IMPL'] = 'true' if use_schema else 'false'
 
-    # Clear module cache
-    import sys
-    modules_to_clear = [
-        'apiflask.settings',
-        'apiflask.scaffold',
-    ]
-    for module in modules_to_clear:
-        if module in sys.modules:
-            del sys.modules[module]
+    _clear_impl_modules()
 
     yield impl
 
@@ -162,15 +182,7 @@ def switch_implementation(use_schema: bool):
     try:
         os.environ['APIFLASK_USE_SCHEMA_IMPL'] = 'true' if use_schema else 'false'
 
-        # Clear module cache
-        import sys
-        modules_to_clear = [
-            'apiflask.settings',
-            'apiflask.scaffold',
-        ]
-        for module in modules_to_clear:
-            if module in sys.modules:
-                del sys.modules[module]
+        _clear_impl_modules()
 
         yield
     finally:
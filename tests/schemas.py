@@ -26,6 +26,10 @@ class Bar(Schema):
     name2 = String(required=True)
 
 
+class FooIn(Schema):
+    bar = String(required=True)
+
+
 class Baz(Schema):
     id = Integer(dump_default=123)
     name = String()
@@ -78,6 +82,21 @@ class Header(Schema):
     foo = String(load_default='bar')
 
 
+class HeaderWithDataKey(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    foo = String(data_key='X-Foo', required=True)
+    bar = String(data_key='X-Bar', load_default='bar')
+
+
+class Cookie(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    foo = String(load_default='bar')
+
+
 class ValidationError(Schema):
     status_code = String(required=True)
     message = String(required=True)
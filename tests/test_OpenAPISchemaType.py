@@ -4,7 +4,6 @@ Example test file showing how to write tests that work with both implementations
 
 import os
 import pytest
-from unittest.mock import patch
 from contextlib import contextmanager
 
 from apiflask import APIFlask
@@ -146,7 +145,7 @@ class TestImplementationSpecific:
             from apiflask import APIFlask
 
             # Test that we're using the types implementation
-            import apiflask.settings
+            import apiflask.settings  # noqa: F401
             # The types implementation is just a type alias
 
             app = APIFlask(__name__)
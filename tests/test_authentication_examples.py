@@ -13,6 +13,8 @@ from authlib.jose import jwt, JoseError
 from apiflask import APIFlask, HTTPBasicAuth, HTTPTokenAuth, Schema, abort
 from apiflask.fields import Integer, String
 
+EXPECTED_AUTH_FAIL = 'Authentication failed. Please provide valid credentials.'
+
 
 class TestBasicAuthExample:
     """Test suite for the basic authentication example."""
@@ -60,7 +62,7 @@ class TestBasicAuthExample:
             body = {
                 'status_code': error.status_code,
                 'message': error.message,
-                'detail': 'Authentication failed. Please provide valid credentials.'
+                'detail': EXPECTED_AUTH_FAIL
             }
             return body, error.status_code, error.headers
 
@@ -191,7 +193,7 @@ class TestBasicAuthExample:
         assert 'message' in rv.json
         assert 'detail' in rv.json
         assert rv.json['status_code'] == 401
-        assert 'Authentication failed' in rv.json['detail']
+        assert rv.json['detail'] == EXPECTED_AUTH_FAIL
 
     def test_all_endpoints_with_both_users(self, basic_auth_client):
         """Comprehensive test of all endpoints with both user types."""
@@ -532,7 +534,3 @@ class TestAuthenticationPerformance:
         headers = {'Authorization': 'Bearer'}
         rv = client.get('/name/1', headers=headers)
         assert rv.status_code == 401
-
-
-if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
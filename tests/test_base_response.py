@@ -1,4 +1,3 @@
-import openapi_spec_validator as osv
 import pytest
 
 from .schemas import Foo
@@ -58,6 +57,38 @@ def test_output_base_response(app, client):
     assert rv.json['data']['name'] == 'test'
 
 
+def test_base_response_schema_cache(app, client, monkeypatch):
+    class NewBaseResponse(BaseResponse):
+        version = Integer(dump_default=2)
+
+    instances = []
+    init = Schema.__init__
+
+    def counting_init(self, *args, **kwargs):
+        instances.append(type(self))
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Schema, '__init__', counting_init)
+    app.config['BASE_RESPONSE_SCHEMA'] = BaseResponse
+
+    @app.get('/')
+    @app.output(Foo)
+    def foo():
+        data = {'id': '123', 'name': 'test'}
+        return {'message': 'Success.', 'status_code': '200', 'data': data}
+
+    rv = client.get('/')
+    assert 'version' not in rv.json
+    client.get('/')
+    assert instances.count(BaseResponse) == 1
+
+    app.config['BASE_RESPONSE_SCHEMA'] = NewBaseResponse
+    rv = client.get('/')
+    assert rv.json['version'] == 2
+    client.get('/')
+    assert instances.count(NewBaseResponse) == 1
+
+
 @pytest.mark.parametrize(
     'base_schema',
     [
@@ -69,7 +100,7 @@ def test_output_base_response(app, client):
         None,
     ],
 )
-def test_base_response_spec(app, client, base_schema):
+def test_base_response_spec(app, client, base_schema, spec_validator):
     app.config['BASE_RESPONSE_SCHEMA'] = base_schema
 
     @app.get('/')
@@ -89,7 +120,7 @@ def test_base_response_spec(app, client, base_schema):
     else:
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         schema = rv.json['paths']['/']['get']['responses']['200']['content']['application/json'][
             'schema'
         ]
@@ -121,7 +152,7 @@ def test_base_response_data_key(app, client):
             foo()
 
 
-def test_base_response_204(app, client):
+def test_base_response_204(app, client, spec_validator):
     app.config['BASE_RESPONSE_SCHEMA'] = BaseResponse
 
     @app.get('/')
@@ -131,7 +162,7 @@ def test_base_response_204(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert 'content' not in rv.json['paths']['/']['get']['responses']['204']
 
 
@@ -152,7 +183,7 @@ def test_base_response_many(app, client):
     assert isinstance(rv.json['data'], list)
 
 
-def test_bare_view_base_response_spec(app, client):
+def test_bare_view_base_response_spec(app, client, spec_validator):
     app.config['BASE_RESPONSE_SCHEMA'] = BaseResponse
 
     @app.get('/')
@@ -162,7 +193,7 @@ def test_bare_view_base_response_spec(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     schema = rv.json['paths']['/']['get']['responses']['200']['content']['application/json'][
         'schema'
     ]
@@ -170,7 +201,7 @@ def test_bare_view_base_response_spec(app, client):
     assert schema['properties']['message'] == {'type': 'string'}
 
 
-def test_input_with_base_response_spec(app, client):
+def test_input_with_base_response_spec(app, client, spec_validator):
     app.config['BASE_RESPONSE_SCHEMA'] = BaseResponse
 
     @app.get('/')
@@ -181,7 +212,7 @@ def test_input_with_base_response_spec(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     schema = rv.json['paths']['/']['get']['responses']['200']['content']['application/json'][
         'schema'
     ]
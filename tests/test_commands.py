@@ -1,24 +1,50 @@
-import json
+from pathlib import Path
 
 import pytest
+from flask import json
 
 from .schemas import Foo
 from .schemas import Qux
 from apiflask.commands import spec_command
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+EXPECTED_JSON_TITLE = '"title": "APIFlask",'
+EXPECTED_YAML_TITLE = 'title: APIFlask'
+EXPECTED_COMPACT_JSON_PREFIX = '{"info": {'
+EXPECTED_INDENT_2_JSON_PREFIX = '{\n' + ' ' * 2 + '"info": {'
+EXPECTED_INDENT_4_JSON_PREFIX = '{\n' + ' ' * 4 + '"info": {'
+
 
 def test_flask_spec_stdout(app, cli_runner):
     result = cli_runner.invoke(spec_command)
-    assert 'openapi' in result.output
-    assert json.loads(result.output) == app.spec
+    output = result.output
+    assert 'openapi' in output
+    assert _loads(output) == app.spec
 
 
 def test_flask_spec_output(app, cli_runner, tmp_path):
     local_spec_path = tmp_path / 'openapi.json'
     result = cli_runner.invoke(spec_command, ['--output', str(local_spec_path)])
-    assert 'openapi' in result.output
-    with open(local_spec_path) as f:
-        assert json.loads(f.read()) == app.spec
+    output = result.output
+    assert '"openapi"' in output and '"info"' in output
+    assert local_spec_path.read_bytes() == result.stdout_bytes
+
+
+def test_flask_spec_relative_output(app, cli_runner):
+    with cli_runner.isolated_filesystem() as cwd:
+        result = cli_runner.invoke(spec_command, ['--output', 'openapi.json'])
+        assert '"openapi"' in result.output
+        assert (Path(cwd) / 'openapi.json').read_bytes() == result.stdout_bytes
+
+
+def test_flask_spec_output_to_directory(spec_cli_runner, tmp_path):
+    result = spec_cli_runner.invoke(spec_command, ['--output', str(tmp_path)])
+    assert result.exit_code == 2
+    assert 'is a directory' in result.output
 
 
 def test_flask_spec_fields_order(app, cli_runner):
@@ -28,55 +54,114 @@ def test_flask_spec_fields_order(app, cli_runner):
         pass
 
     result = cli_runner.invoke(spec_command)
-    assert 'openapi' in result.output
-    assert json.loads(result.output) == app.spec
-    assert list(json.loads(result.output)['components']['schemas']['Foo']['properties'].keys()) == [
+    output = result.output
+    assert 'openapi' in output
+    spec = _loads(output)
+    assert spec == app.spec
+    assert list(spec['components']['schemas']['Foo']['properties'].keys()) == [
         'id',
         'name',
     ]
 
 
-@pytest.mark.parametrize('format', ['json', 'yaml', 'yml', 'foo'])
-def test_flask_spec_format(app, cli_runner, format, tmp_path):
+@pytest.mark.parametrize(
+    'args,expected,forbidden',
+    [
+        (['--format', 'json'], EXPECTED_JSON_TITLE, EXPECTED_YAML_TITLE),
+        (['--format', 'yaml'], EXPECTED_YAML_TITLE, EXPECTED_JSON_TITLE),
+        (['--format', 'yml'], EXPECTED_YAML_TITLE, EXPECTED_JSON_TITLE),
+        (['--format', 'foo'], 'Invalid value', 'openapi'),
+        (['--format', 'yaml', '--indent', '8'], EXPECTED_YAML_TITLE, '"info"'),
+    ],
+)
+def test_flask_spec_format_and_indent(app, cli_runner, args, expected, forbidden, tmp_path):
     local_spec_path = tmp_path / 'openapi.json'
 
     @app.get('/')
     def hello():
         pass
 
-    stdout_result = cli_runner.invoke(spec_command, ['--format', format])
-    file_result = cli_runner.invoke(
-        spec_command, ['--format', format, '--output', str(local_spec_path)]
-    )
-    if format == 'json':
-        assert '"title": "APIFlask",' in stdout_result.output
-        assert '"title": "APIFlask",' in file_result.output
-    elif format.startswith('y'):
-        assert 'title: APIFlask' in stdout_result.output
-        assert 'title: APIFlask' in file_result.output
-    else:
-        assert 'Invalid value' in stdout_result.output
-        assert 'Invalid value' in file_result.output
-
-
-@pytest.mark.parametrize('indent', [0, 2, 4])
-def test_flask_spec_indent(cli_runner, indent, tmp_path):
+    stdout_result = cli_runner.invoke(spec_command, args)
+    file_result = cli_runner.invoke(spec_command, args + ['--output', str(local_spec_path)])
+    for output in (stdout_result.output, file_result.output):
+        assert expected in output
+        assert forbidden not in output
+
+
+def test_flask_spec_yaml_with_cached_json_spec(app, cli_runner):
+    assert isinstance(app._get_spec('json'), dict)
+
+    result = cli_runner.invoke(spec_command, ['--format', 'yaml'])
+    assert result.exit_code == 0
+    assert EXPECTED_YAML_TITLE in result.output
+    assert EXPECTED_JSON_TITLE not in result.output
+
+
+@pytest.mark.parametrize(
+    'indent,prefix',
+    [
+        (0, EXPECTED_COMPACT_JSON_PREFIX),
+        (1, '{\n "info": {'),
+        (2, EXPECTED_INDENT_2_JSON_PREFIX),
+        (4, EXPECTED_INDENT_4_JSON_PREFIX),
+        (20, '{\n' + ' ' * 20 + '"info": {'),
+    ],
+)
+def test_flask_spec_indent(spec_cli_runner, indent, prefix, tmp_path):
+    local_spec_path = tmp_path / 'openapi.json'
+    args = ['--indent', str(indent), '--output', str(local_spec_path)]
+    result = spec_cli_runner.invoke(spec_command, args)
+    assert result.output.startswith(prefix)
+    assert local_spec_path.read_bytes() == result.stdout_bytes
+
+
+def test_flask_spec_zero_indent_explicit_vs_none(app):
+    cli_runner = app.test_cli_runner()
+    explicit_result = cli_runner.invoke(spec_command, ['--indent', '0'])
+    default_result = cli_runner.invoke(spec_command)
+    assert EXPECTED_COMPACT_JSON_PREFIX in explicit_result.output
+    assert EXPECTED_INDENT_2_JSON_PREFIX in default_result.output
+
+
+@pytest.mark.parametrize(
+    'title,value',
+    [
+        ('APIFlask', None),
+        ('Café', None),
+        ('APIFlask', 2**64),
+        ('APIFlask', 1e16),
+        ('APIFlask', float('nan')),
+    ],
+)
+def test_flask_spec_indent_2_matches_stdlib(app, cli_runner, title, value):
+    app.title = title
+
+    @app.spec_processor
+    def update_spec(spec):
+        spec['info']['x-value'] = value
+        return spec
+
+    result = cli_runner.invoke(spec_command, ['--indent', '2'])
+    assert result.exit_code == 0
+    with app.app_context():
+        assert result.output == json.dumps(app.spec, indent=2) + '\n'
+
+
+def test_flask_spec_quiet(spec_cli_runner, monkeypatch):
+    def fail_dumps_spec(spec, indent):
+        raise AssertionError('the spec should not be serialized')
+
+    monkeypatch.setattr('apiflask.commands._dumps_spec', fail_dumps_spec)
+    result = spec_cli_runner.invoke(spec_command, ['--quiet'])
+    assert result.exit_code == 0
+    assert result.output == ''
+
+
+def test_flask_spec_quiet_with_output(spec_cli_runner, tmp_path):
     local_spec_path = tmp_path / 'openapi.json'
-    stdout_result = cli_runner.invoke(spec_command, ['--indent', indent])
-    file_result = cli_runner.invoke(
-        spec_command, ['--indent', indent, '--output', str(local_spec_path)]
-    )
-    if indent == 0:
-        assert '{"info": {' in stdout_result.output
-        assert '{"info": {' in file_result.output
-    else:
-        assert f'{{\n{" " * indent}"info": {{' in stdout_result.output
-        assert f'{{\n{" " * indent}"info": {{' in file_result.output
-
-
-def test_flask_spec_quiet(app, cli_runner):
-    result = cli_runner.invoke(spec_command, ['--quiet'])
+    result = spec_cli_runner.invoke(spec_command, ['--quiet', '--output', str(local_spec_path)])
     assert result.output == ''
+    assert local_spec_path.read_bytes().startswith(EXPECTED_COMPACT_JSON_PREFIX.encode())
 
 
 def test_flask_spec_decimal_field(app, cli_runner):
@@ -87,3 +172,11 @@ def test_flask_spec_decimal_field(app, cli_runner):
 
     result = cli_runner.invoke(spec_command)
     assert 'openapi' in result.output
+
+
+@pytest.mark.parametrize('indent', ['0', '2'])
+def test_flask_spec_non_ascii(app, cli_runner, indent):
+    app.title = 'Café'
+
+    result = cli_runner.invoke(spec_command, ['--indent', indent])
+    assert '"title": "Caf\\u00e9",' in result.output
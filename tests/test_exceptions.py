@@ -415,7 +415,6 @@ class TestValidationError:
     def test_validation_error_with_different_locations(self, app):
         """Test that _ValidationError works correctly with different webargs locations."""
         from apiflask.scaffold import FlaskParser
-        from apiflask.fields import Integer
         from flask import request as flask_request
 
         parser = FlaskParser()
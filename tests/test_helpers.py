@@ -11,9 +11,9 @@ Test coverage includes:
 - Error handling and edge cases
 """
 
+from dataclasses import dataclass
+
 import pytest
-from unittest.mock import Mock, patch
-from flask import Flask, request
 
 from apiflask import APIFlask
 from apiflask.helpers import get_reason_phrase, pagination_builder
@@ -58,19 +58,18 @@ class TestGetReasonPhrase:
         assert get_reason_phrase(304) == 'Not Modified'
 
 
+@dataclass(frozen=True)
 class MockPagination:
     """Mock pagination object that mimics Flask-SQLAlchemy's Pagination class."""
 
-    def __init__(self, page=1, per_page=20, total=100, pages=5,
-                 has_next=True, has_prev=True, next_num=2, prev_num=0):
-        self.page = page
-        self.per_page = per_page
-        self.total = total
-        self.pages = pages
-        self.has_next = has_next
-        self.has_prev = has_prev
-        self.next_num = next_num
-        self.prev_num = prev_num
+    page: int = 1
+    per_page: int = 20
+    total: int = 100
+    pages: int = 5
+    has_next: bool = True
+    has_prev: bool = True
+    next_num: int = 2
+    prev_num: int = 0
 
 
 class TestPaginationBuilder:
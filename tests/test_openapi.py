@@ -1,11 +1,7 @@
 import json
 import pytest
-import os
-from unittest.mock import patch
-from contextlib import contextmanager
 import importlib
 
-import openapi_spec_validator as osv
 from flask import request
 
 from .schemas import Bar, Baz, Foo, Header, Pagination, Query, ResponseHeader
@@ -22,7 +18,7 @@ class TestOpenAPIBasic:
         assert 'openapi' in app.spec
 
 
-    def test_spec_processor(self, app, client):
+    def test_spec_processor(self, app, client, spec_validator):
         @app.spec_processor
         def edit_spec(spec):
             assert spec['openapi'] == '3.0.3'
@@ -34,12 +30,12 @@ class TestOpenAPIBasic:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['openapi'] == '3.0.2'
         assert rv.json['info']['title'] == 'Foo'
 
 
-    def test_spec_processor_pass_object(self, app, client):
+    def test_spec_processor_pass_object(self, app, client, spec_validator):
         app.config['SPEC_PROCESSOR_PASS_OBJECT'] = True
 
         class NotUsedSchema(Schema):
@@ -53,7 +49,7 @@ class TestOpenAPIBasic:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['info']['title'] == 'Foo'
         assert 'NotUsed' in rv.json['components']['schemas']
         assert 'id' in rv.json['components']['schemas']['NotUsed']['properties']
@@ -84,6 +80,38 @@ class TestOpenAPIBasic:
         assert '/foo' in new_spec['paths']
 
 
+    def test_spec_response_cache(self, app, client):
+        rv = client.get('/openapi.json')
+        assert rv.status_code == 200
+        assert rv.json['info']['title'] == 'APIFlask'
+        assert client.get('/openapi.json').data == rv.data
+
+        app.title = 'Foo'
+        rv = client.get('/openapi.json')
+        assert rv.json['info']['title'] == 'APIFlask'
+
+        # the response body follows the regenerated spec
+        assert app.spec['info']['title'] == 'Foo'
+        rv = client.get('/openapi.json')
+        assert rv.json['info']['title'] == 'Foo'
+
+
+    def test_spec_response_cache_with_same_spec_object(self, app, client):
+        spec = {'openapi': '3.0.3', 'info': {'title': 'Foo', 'version': '1.0'}, 'paths': {}}
+
+        @app.spec_processor
+        def update_spec(_):
+            return spec
+
+        rv = client.get('/openapi.json')
+        assert rv.json['info']['title'] == 'Foo'
+
+        spec['info']['title'] = 'Bar'
+        assert app.spec is spec
+        rv = client.get('/openapi.json')
+        assert rv.json['info']['title'] == 'Bar'
+
+
     def test_spec_bypass_endpoints(self, app):
         bp = APIBlueprint('foo', __name__, static_folder='static', url_prefix='/foo')
         app.register_blueprint(bp)
@@ -160,7 +188,7 @@ class TestOpenAPIBasic:
         assert 'Ham' in spec['components']['schemas']
 
 
-    def test_servers_and_externaldocs(self, app):
+    def test_servers_and_externaldocs(self, app, spec_validator):
         assert app.external_docs is None
         assert app.servers is None
 
@@ -172,7 +200,7 @@ class TestOpenAPIBasic:
 
         rv = app.test_client().get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['externalDocs'] == {
             'description': 'Find more info here',
             'url': 'https://docs.example.com/',
@@ -183,12 +211,12 @@ class TestOpenAPIBasic:
         ]
 
 
-    def test_default_servers(self, app):
+    def test_default_servers(self, app, spec_validator):
         assert app.servers is None
 
         rv = app.test_client().get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         with app.test_request_context():
             assert rv.json['servers'] == [
                 {
@@ -203,7 +231,7 @@ class TestOpenAPIBasic:
         assert 'servers' not in json.loads(result.output)
 
 
-    def test_auto_200_response(self, app, client):
+    def test_auto_200_response(self, app, client, spec_validator):
         @app.get('/foo')
         def bare():
             pass
@@ -230,7 +258,7 @@ class TestOpenAPIBasic:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert '200' in rv.json['paths']['/foo']['get']['responses']
         assert '200' in rv.json['paths']['/bar']['get']['responses']
         assert '200' in rv.json['paths']['/baz']['get']['responses']
@@ -239,23 +267,53 @@ class TestOpenAPIBasic:
         assert rv.json['paths']['/spam']['get']['responses']['204']['description'] == 'empty'
 
 
-    def test_sync_local_json_spec(self, app, client, tmp_path):
+    def test_sync_local_json_spec(self, app, client, tmp_path, spec_validator):
         app.config['AUTO_SERVERS'] = False
 
         local_spec_path = tmp_path / 'openapi.json'
         app.config['SYNC_LOCAL_SPEC'] = True
         app.config['LOCAL_SPEC_PATH'] = local_spec_path
+        app.config['LOCAL_SPEC_JSON_INDENT'] = 0
         app.config['SPEC_FORMAT'] = 'json'
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
 
-        with open(local_spec_path) as f:
-            spec_content = json.loads(f.read())
-            assert spec_content == app.spec
-            assert 'info' in spec_content
-            assert 'paths' in spec_content
+        raw_spec = local_spec_path.read_text()
+        assert '\n' not in raw_spec
+        spec_content = json.loads(raw_spec)
+        assert spec_content == app.spec
+        assert 'info' in spec_content
+        assert 'paths' in spec_content
+
+
+    def test_sync_local_spec_only_when_changed(self, app, client, tmp_path):
+        local_spec_path = tmp_path / 'openapi.json'
+        app.config['SYNC_LOCAL_SPEC'] = True
+        app.config['LOCAL_SPEC_PATH'] = local_spec_path
+
+        client.get('/openapi.json')
+        spec_content = local_spec_path.read_text()
+        mtime = local_spec_path.stat().st_mtime_ns
+
+        # the unchanged file is not written again
+        client.get('/openapi.json')
+        assert local_spec_path.stat().st_mtime_ns == mtime
+
+        local_spec_path.unlink()
+        client.get('/openapi.json')
+        assert local_spec_path.read_text() == spec_content
+
+        local_spec_path.write_text('{}')
+        client.get('/openapi.json')
+        assert local_spec_path.read_text() == spec_content
+
+        app.config['LOCAL_SPEC_JSON_INDENT'] = 4
+        rv = client.get('/openapi.json')
+        spec_content = local_spec_path.read_text()
+        assert spec_content.startswith('{\n    "info": {')
+        assert json.loads(spec_content) == rv.json
 
 
     def test_sync_local_yaml_spec(self, app, client, tmp_path):
@@ -269,10 +327,9 @@ class TestOpenAPIBasic:
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
 
-        with open(local_spec_path) as f:
-            spec_content = f.read()
-            assert spec_content == str(app.spec)
-            assert 'title: APIFlask' in spec_content
+        spec_content = local_spec_path.read_text()
+        assert spec_content == str(app.spec)
+        assert 'title: APIFlask' in spec_content
 
 
     def test_sync_local_spec_no_path(self, app):
@@ -432,7 +489,7 @@ class TestOpenAPIBlueprint:
 
 class TestOpenAPIExtensions:
 
-    def test_specification_extensions(self, app, client):
+    def test_specification_extensions(self, app, client, spec_validator):
         @app.get('/')
         @app.doc(extensions={'x-foo': {'foo': 'bar'}})
         def foo():
@@ -440,11 +497,11 @@ class TestOpenAPIExtensions:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/']['get']['x-foo'] == {'foo': 'bar'}
 
 class TestOpenAPIHeaders:
-    def test_spec_with_dict_headers(self, app, client):
+    def test_spec_with_dict_headers(self, app):
         @app.route('/foo')
         @app.output(
             Foo,
@@ -459,8 +516,8 @@ class TestOpenAPIHeaders:
         def foo():
             pass
 
-        rv = client.get('/openapi.json')
-        assert rv.json['paths']['/foo']['get']['responses']['200']['headers'] == {
+        spec = app.spec
+        assert spec['paths']['/foo']['get']['responses']['200']['headers'] == {
             'X-boolean': {
                 'description': 'A boolean header',
                 'required': False,
@@ -491,24 +548,24 @@ class TestOpenAPIHeaders:
         }
 
 
-    def test_spec_with_empty_headers(self, app, client):
+    def test_spec_with_empty_headers(self, app):
         @app.route('/foo')
         @app.output(Foo, headers={})
         def foo():
             pass
 
-        rv = client.get('/openapi.json')
-        assert rv.json['paths']['/foo']['get']['responses']['200']['headers'] == {}
+        spec = app.spec
+        assert spec['paths']['/foo']['get']['responses']['200']['headers'] == {}
 
 
-    def test_spec_with_schema_headers(self, app, client):
+    def test_spec_with_schema_headers(self, app):
         @app.route('/foo')
         @app.output(Foo, headers=ResponseHeader)
         def foo():
             pass
 
-        rv = client.get('/openapi.json')
-        assert rv.json['paths']['/foo']['get']['responses']['200']['headers'] == {
+        spec = app.spec
+        assert spec['paths']['/foo']['get']['responses']['200']['headers'] == {
             'X-Token': {
                 'description': 'A custom token header',
                 'required': True,
@@ -518,7 +575,7 @@ class TestOpenAPIHeaders:
 
 
     @pytest.mark.parametrize('openapi_version', ['3.0.0', '3.1.0'])
-    def test_spec_validity_with_headers(self, app, client, openapi_version):
+    def test_spec_validity_with_headers(self, app, client, openapi_version, spec_validator):
         app.config['OPENAPI_VERSION'] = openapi_version
 
         @app.route('/foo')
@@ -528,7 +585,7 @@ class TestOpenAPIHeaders:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
 
 class TestOpenAPIInfo:
 
@@ -541,7 +598,7 @@ class TestOpenAPIInfo:
         assert app.spec['info']['version'] == '1.0'
 
 
-    def test_other_info_fields(self, app, client):
+    def test_other_info_fields(self, app, client, spec_validator):
         assert app.description is None
         assert app.terms_of_service is None
         assert app.contact is None
@@ -558,14 +615,14 @@ class TestOpenAPIInfo:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['info']['description'] == app.description
         assert rv.json['info']['termsOfService'] == app.terms_of_service
         assert rv.json['info']['contact'] == app.contact
         assert rv.json['info']['license'] == app.license
 
 
-    def test_info_attribute(self, app, client):
+    def test_info_attribute(self, app, client, spec_validator):
         assert app.info is None
 
         app.info = {
@@ -581,14 +638,14 @@ class TestOpenAPIInfo:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['info']['description'] == app.info['description']
         assert rv.json['info']['termsOfService'] == app.info['termsOfService']
         assert rv.json['info']['contact'] == app.info['contact']
         assert rv.json['info']['license'] == app.info['license']
 
 
-    def test_overwirte_info_attribute(self, app, client):
+    def test_overwirte_info_attribute(self, app, client, spec_validator):
         assert app.info is None
         assert app.description is None
         assert app.terms_of_service is None
@@ -613,14 +670,14 @@ class TestOpenAPIInfo:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['info']['description'] == app.description
         assert rv.json['info']['termsOfService'] == app.terms_of_service
         assert rv.json['info']['contact'] == app.contact
         assert rv.json['info']['license'] == app.license
 
 class TestOpenAPIPaths:
-    def test_spec_path_summary_description_from_docs(self, app, client):
+    def test_spec_path_summary_description_from_docs(self, app, client, spec_validator):
         @app.route('/users')
         @app.output(Foo)
         def get_users():
@@ -638,7 +695,7 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/users']['get']['summary'] == 'Get Users'
         assert rv.json['paths']['/users/{id}']['put']['summary'] == 'Update User'
         assert (
@@ -646,7 +703,7 @@ class TestOpenAPIPaths:
         )
 
 
-    def test_spec_path_parameters_registration(self, app, client):
+    def test_spec_path_parameters_registration(self, app, client, spec_validator):
         @app.route('/strings/<some_string>')
         @app.output(Foo)
         def get_string(some_string):
@@ -669,7 +726,7 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/strings/{some_string}']['get']['parameters'][0]['in'] == 'path'
         assert (
             rv.json['paths']['/strings/{some_string}']['get']['parameters'][0]['name'] == 'some_string'
@@ -696,7 +753,7 @@ class TestOpenAPIPaths:
         )
 
 
-    def test_spec_path_summary_auto_generation(self, app, client):
+    def test_spec_path_summary_auto_generation(self, app, client, spec_validator):
         @app.route('/users')
         @app.output(Foo)
         def get_users():
@@ -718,7 +775,7 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/users']['get']['summary'] == 'Get Users'
         assert rv.json['paths']['/users/{id}']['put']['summary'] == 'Update User'
         assert rv.json['paths']['/users/{id}']['delete']['summary'] == 'Summary from Docs'
@@ -728,7 +785,7 @@ class TestOpenAPIPaths:
         )
 
 
-    def test_path_arguments_detection(self, app, client):
+    def test_path_arguments_detection(self, app, client, spec_validator):
         @app.route('/foo/<bar>')
         @app.output(Foo)
         def pattern1(bar):
@@ -756,7 +813,7 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert '/foo/{bar}' in rv.json['paths']
         assert '/{foo}/bar' in rv.json['paths']
         assert '/{foo}/{bar}/baz' in rv.json['paths']
@@ -774,7 +831,7 @@ class TestOpenAPIPaths:
         )
 
 
-    def test_path_arguments_order(self, app, client):
+    def test_path_arguments_order(self, app, client, spec_validator):
         @app.route('/<foo>/bar')
         @app.input(Query, location='query')
         @app.output(Foo)
@@ -788,7 +845,7 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert '/{foo}/bar' in rv.json['paths']
         assert '/{foo}/{bar}' in rv.json['paths']
         assert rv.json['paths']['/{foo}/bar']['get']['parameters'][0]['name'] == 'foo'
@@ -797,7 +854,7 @@ class TestOpenAPIPaths:
         assert rv.json['paths']['/{foo}/{bar}']['get']['parameters'][1]['name'] == 'bar'
 
 
-    def test_parameters_registration(self, app, client):
+    def test_parameters_registration(self, app, client, spec_validator):
         @app.route('/foo')
         @app.input(Query, location='query')
         @app.output(Foo)
@@ -813,7 +870,7 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert '/foo' in rv.json['paths']
         assert '/bar' in rv.json['paths']
         assert rv.json['paths']['/foo']['get']['parameters'][0]['name'] == 'id'
@@ -827,7 +884,7 @@ class TestOpenAPIPaths:
         assert rv.json['foo'] == 'bar'
 
 
-    def test_register_validation_error_response(self, app, client):
+    def test_register_validation_error_response(self, app, client, spec_validator):
         error_code = str(app.config['VALIDATION_ERROR_STATUS_CODE'])
 
         @app.post('/foo')
@@ -842,20 +899,14 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
-        assert rv.json['paths']['/foo']['post']['responses'][error_code] is not None
-        assert (
-            rv.json['paths']['/foo']['post']['responses'][error_code]['description']
-            == 'Validation error'
-        )
-        assert rv.json['paths']['/bar']['get']['responses'][error_code] is not None
-        assert (
-            rv.json['paths']['/bar']['get']['responses'][error_code]['description']
-            == 'Validation error'
-        )
+        spec_validator(rv.json).validate()
+        for path, method in [('/foo', 'post'), ('/bar', 'get')]:
+            response = rv.json['paths'][path][method]['responses'][error_code]
+            assert response is not None
+            assert response['description'] == 'Validation error'
 
 
-    def test_auto_404_error(self, app, client):
+    def test_auto_404_error(self, app, client, spec_validator):
         @app.get('/foo')
         def foo():
             pass
@@ -871,7 +922,7 @@ class TestOpenAPIPaths:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert '404' not in rv.json['paths']['/foo']['get']['responses']
         assert '404' in rv.json['paths']['/bar/{id}']['get']['responses']
         assert rv.json['paths']['/bar/{id}']['get']['responses']['404']['description'] == 'Not found'
@@ -880,7 +931,7 @@ class TestOpenAPIPaths:
         )
 
 class TestOpenAPISecurity:
-    def test_httpbasicauth_security_scheme(self, app, client):
+    def test_httpbasicauth_security_scheme(self, app, client, spec_validator):
         auth = HTTPBasicAuth()
 
         @app.get('/')
@@ -890,7 +941,7 @@ class TestOpenAPISecurity:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert 'BasicAuth' in rv.json['components']['securitySchemes']
         assert rv.json['components']['securitySchemes']['BasicAuth'] == {
             'type': 'http',
@@ -898,7 +949,7 @@ class TestOpenAPISecurity:
         }
 
 
-    def test_httptokenauth_security_scheme(self, app, client):
+    def test_httptokenauth_security_scheme(self, app, client, spec_validator):
         auth = HTTPTokenAuth()
 
         @app.get('/')
@@ -908,7 +959,7 @@ class TestOpenAPISecurity:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert 'BearerAuth' in rv.json['components']['securitySchemes']
         assert rv.json['components']['securitySchemes']['BearerAuth'] == {
             'scheme': 'bearer',
@@ -916,7 +967,7 @@ class TestOpenAPISecurity:
         }
 
 
-    def test_apikey_auth_security_scheme(self, app, client):
+    def test_apikey_auth_security_scheme(self, app, client, spec_validator):
         auth = HTTPTokenAuth('apiKey', header='X-API-Key')
 
         @app.get('/')
@@ -926,7 +977,7 @@ class TestOpenAPISecurity:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert 'ApiKeyAuth' in rv.json['components']['securitySchemes']
         assert rv.json['components']['securitySchemes']['ApiKeyAuth'] == {
             'type': 'apiKey',
@@ -935,7 +986,7 @@ class TestOpenAPISecurity:
         }
 
 
-    def test_custom_security_scheme_name(self, app, client):
+    def test_custom_security_scheme_name(self, app, client, spec_validator):
         basic_auth = HTTPBasicAuth(security_scheme_name='basic_auth')
         token_auth = HTTPTokenAuth(header='X-API-Key', security_scheme_name='myToken')
 
@@ -951,7 +1002,7 @@ class TestOpenAPISecurity:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert 'basic_auth' in rv.json['components']['securitySchemes']
         assert 'myToken' in rv.json['components']['securitySchemes']
         assert rv.json['components']['securitySchemes']['basic_auth'] == {
@@ -982,7 +1033,7 @@ class TestOpenAPISecurity:
             app.spec
 
 
-    def test_multiple_auth_names(self, app, client):
+    def test_multiple_auth_names(self, app, client, spec_validator):
         auth1 = HTTPBasicAuth()
         auth2 = HTTPBasicAuth()
         auth3 = HTTPBasicAuth()
@@ -1004,13 +1055,13 @@ class TestOpenAPISecurity:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert 'BasicAuth' in rv.json['components']['securitySchemes']
         assert 'BasicAuth_2' in rv.json['components']['securitySchemes']
         assert 'BasicAuth_3' in rv.json['components']['securitySchemes']
 
 
-    def test_security_schemes_description(self, app, client):
+    def test_security_schemes_description(self, app, client, spec_validator):
         basic_auth = HTTPBasicAuth(description='some description for basic auth')
         token_auth = HTTPTokenAuth(description='some description for bearer auth')
 
@@ -1026,7 +1077,7 @@ class TestOpenAPISecurity:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert 'BasicAuth' in rv.json['components']['securitySchemes']
         assert 'BearerAuth' in rv.json['components']['securitySchemes']
         assert rv.json['components']['securitySchemes']['BasicAuth'] == {
@@ -1042,7 +1093,7 @@ class TestOpenAPISecurity:
 
 class TestOpenAPITags:
 
-    def test_tags(self, app, client):
+    def test_tags(self, app, client, spec_validator):
         assert app.tags is None
         app.tags = [
             {
@@ -1058,7 +1109,7 @@ class TestOpenAPITags:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['tags']
         assert {'name': 'bar', 'description': 'some description for bar'} in rv.json['tags']
         assert rv.json['tags'][0]['name'] == 'foo'
@@ -1067,31 +1118,31 @@ class TestOpenAPITags:
         assert rv.json['tags'][0]['externalDocs']['url'] == 'https://docs.example.com/'
 
 
-    def test_simple_tags(self, app, client):
+    def test_simple_tags(self, app, client, spec_validator):
         assert app.tags is None
         app.tags = ['foo', 'bar', 'baz']
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['tags']
         assert {'name': 'foo'} in rv.json['tags']
         assert {'name': 'bar'} in rv.json['tags']
         assert {'name': 'baz'} in rv.json['tags']
 
 
-    def test_simple_tag_from_blueprint(self, app, client):
+    def test_simple_tag_from_blueprint(self, app, client, spec_validator):
         bp = APIBlueprint('test', __name__, tag='foo')
         app.register_blueprint(bp)
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['tags']
         assert {'name': 'foo'} in rv.json['tags']
 
 
-    def test_tag_from_blueprint(self, app, client):
+    def test_tag_from_blueprint(self, app, client, spec_validator):
         tag = {
             'name': 'foo',
             'description': 'some description for foo',
@@ -1105,7 +1156,7 @@ class TestOpenAPITags:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['tags']
         assert rv.json['tags'][0]['name'] == 'foo'
         assert rv.json['tags'][0]['description'] == 'some description for foo'
@@ -1113,13 +1164,13 @@ class TestOpenAPITags:
         assert rv.json['tags'][0]['externalDocs']['url'] == 'https://docs.example.com/'
 
 
-    def test_auto_tag_from_blueprint(self, app, client):
+    def test_auto_tag_from_blueprint(self, app, client, spec_validator):
         bp = APIBlueprint('foo', __name__)
         app.register_blueprint(bp)
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['tags']
         assert {'name': 'Foo'} in rv.json['tags']
 
@@ -1128,7 +1179,7 @@ class TestOpenAPITags:
         importlib.metadata.version('flask') < '2.0.1',
         reason='Depends on new behaviour introduced in Flask 2.0.1',
     )
-    def test_auto_tag_from_nesting_blueprints(self, app, client):
+    def test_auto_tag_from_nesting_blueprints(self, app, client, spec_validator):
         parent_bp = APIBlueprint('parent', __name__)
         child_bp = APIBlueprint('child', __name__)
         parent_bp.register_blueprint(child_bp)
@@ -1136,13 +1187,13 @@ class TestOpenAPITags:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['tags']
         assert {'name': 'Parent'} in rv.json['tags']
         assert {'name': 'Parent.Child'} in rv.json['tags']
 
 
-    def test_path_tags(self, app, client):
+    def test_path_tags(self, app, client, spec_validator):
         bp = APIBlueprint('foo', __name__)
 
         @bp.get('/')
@@ -1153,12 +1204,12 @@ class TestOpenAPITags:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/']['get']['tags'] == ['Foo']
 
 
     @pytest.mark.parametrize('tag', ['test', {'name': 'test'}])
-    def test_path_tags_with_blueprint_tag(self, app, client, tag):
+    def test_path_tags_with_blueprint_tag(self, app, client, tag, spec_validator):
         bp = APIBlueprint('foo', __name__, tag=tag)
 
         @bp.get('/')
@@ -1169,7 +1220,7 @@ class TestOpenAPITags:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/']['get']['tags'] == ['test']
 
 
@@ -1177,7 +1228,7 @@ class TestOpenAPITags:
         importlib.metadata.version('flask') < '2.0.1',
         reason='Depends on new behaviour introduced in Flask 2.0.1',
     )
-    def test_path_tags_with_nesting_blueprints(self, app, client):
+    def test_path_tags_with_nesting_blueprints(self, app, client, spec_validator):
         parent_bp = APIBlueprint('parent', __name__, url_prefix='/parent')
         child_bp = APIBlueprint('child', __name__, url_prefix='/child')
 
@@ -1194,7 +1245,7 @@ class TestOpenAPITags:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/parent/']['get']['tags'] == ['Parent']
         assert rv.json['paths']['/parent/child/']['get']['tags'] == ['Parent.Child']
 
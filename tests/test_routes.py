@@ -1,4 +1,3 @@
-import openapi_spec_validator as osv
 import pytest
 from flask.views import MethodView
 from flask.views import View
@@ -9,7 +8,7 @@ from apiflask import HTTPTokenAuth
 
 
 @pytest.mark.parametrize('method', ['get', 'post', 'put', 'patch', 'delete'])
-def test_route_shortcuts(app, client, method):
+def test_route_shortcuts(app, client, method, spec_validator):
     route_method = getattr(app, method)
     client_method = getattr(client, method)
 
@@ -22,7 +21,7 @@ def test_route_shortcuts(app, client, method):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert rv.json['paths']['/pet'][method]
 
 
@@ -105,7 +104,7 @@ def test_bad_route_decorator_usages(app):
                 pass
 
 
-def test_class_attribute_decorators(app, client):
+def test_class_attribute_decorators(app, client, spec_validator):
     auth = HTTPTokenAuth()
 
     @app.route('/')
@@ -125,14 +124,14 @@ def test_class_attribute_decorators(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert '404' in rv.json['paths']['/']['get']['responses']
     assert '404' in rv.json['paths']['/']['post']['responses']
     assert 'BearerAuth' in rv.json['paths']['/']['get']['security'][0]
     assert 'BearerAuth' in rv.json['paths']['/']['post']['security'][0]
 
 
-def test_overwrite_class_attribute_decorators(app, client):
+def test_overwrite_class_attribute_decorators(app, client, spec_validator):
     @app.route('/')
     class Foo(MethodView):
         decorators = [app.doc(deprecated=True, tags=['foo'])]
@@ -150,7 +149,7 @@ def test_overwrite_class_attribute_decorators(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert rv.json['paths']['/']['get']['deprecated']
     assert rv.json['paths']['/']['get']['tags'] == ['foo']
     assert rv.json['paths']['/']['post']['tags'] == ['foo']
@@ -158,7 +157,7 @@ def test_overwrite_class_attribute_decorators(app, client):
     assert 'deprecated' not in rv.json['paths']['/']['post']
 
 
-def test_add_url_rule_with_method_view(app, client):
+def test_add_url_rule_with_method_view(app, client, spec_validator):
     class Foo(MethodView):
         def get(self):
             return 'get'
@@ -176,12 +175,12 @@ def test_add_url_rule_with_method_view(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert rv.json['paths']['/']['get']['summary'] == 'Get Foo'
     assert rv.json['paths']['/']['post']['summary'] == 'Create foo'
 
 
-def test_add_url_rule_with_method_view_as_view(app, client):
+def test_add_url_rule_with_method_view_as_view(app, client, spec_validator):
     class Foo(MethodView):
         def get(self):
             return 'get'
@@ -201,19 +200,19 @@ def test_add_url_rule_with_method_view_as_view(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert rv.json['paths']['/foo/get']['get']['summary'] == 'Get Foo'
     assert rv.json['paths']['/foo/post']['post']['summary'] == 'Create foo'
 
 
-def test_view_endpoint_contains_dot(app, client):
+def test_view_endpoint_contains_dot(app, client, spec_validator):
     @app.route('/', endpoint='hello.world')
     def foo():
         pass
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert rv.json['paths']['/']['get']
 
 
@@ -243,7 +242,7 @@ def test_empty_methodview_class(app, client):
     assert '/foo' not in rv.json['paths']
 
 
-def test_methodview_class_with_subclass(app, client):
+def test_methodview_class_with_subclass(app, client, spec_validator):
     class Foo(MethodView):
         text = 'You are in Foo'
 
@@ -261,5 +260,5 @@ def test_methodview_class_with_subclass(app, client):
 
     rv = client.get('/openapi.json')
     assert rv.status_code == 200
-    osv.validate(rv.json)
+    spec_validator(rv.json).validate()
     assert rv.json['paths']['/foo']['get']['summary'] == 'Get FooSubClass'
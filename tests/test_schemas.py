@@ -12,10 +12,7 @@ This module provides complete test coverage for the schemas module including:
 
 import io
 import pytest
-from typing import Any
 from marshmallow import ValidationError, fields
-from werkzeug.datastructures import FileStorage
-import openapi_spec_validator as osv
 from flask import make_response, send_file
 
 from apiflask import APIFlask, Schema
@@ -27,7 +24,7 @@ from apiflask.schemas import (
     http_error_schema,
     validation_error_detail_schema
 )
-from apiflask.fields import Integer, String, URL, File
+from apiflask.fields import Integer, String, URL
 
 
 class TestEmptySchema:
@@ -94,8 +91,8 @@ class TestEmptySchema:
         rv = client.get('/empty-image')
         assert rv.status_code == 200
 
-        rv_spec = client.get('/openapi.json')
-        response_spec = rv_spec.json['paths']['/empty-image']['get']['responses']['200']
+        spec = app.spec
+        response_spec = spec['paths']['/empty-image']['get']['responses']['200']
         assert 'image/png' in response_spec['content']
         assert response_spec['content']['image/png']['schema'] == {}
 
@@ -129,7 +126,7 @@ class TestFileSchema:
         assert rv.status_code == 200
         assert rv.content_type == 'application/pdf'
 
-    def test_file_schema_binary_format(self, app: APIFlask, client):
+    def test_file_schema_binary_format(self, app: APIFlask):
         """Test FileSchema with binary format (default)"""
         @app.get('/image')
         @app.output(
@@ -139,12 +136,12 @@ class TestFileSchema:
         def get_image():
             return send_file(io.BytesIO(b'JPEG data'), mimetype='image/jpeg')
 
-        rv_spec = client.get('/openapi.json')
-        content = rv_spec.json['paths']['/image']['get']['responses']['200']['content']
+        spec = app.spec
+        content = spec['paths']['/image']['get']['responses']['200']['content']
         assert 'image/jpeg' in content
         assert content['image/jpeg']['schema'] == {'type': 'string', 'format': 'binary'}
 
-    def test_file_schema_base64_format(self, app: APIFlask, client):
+    def test_file_schema_base64_format(self, app: APIFlask):
         """Test FileSchema with base64 format"""
         @app.get('/encoded-file')
         @app.output(
@@ -154,8 +151,8 @@ class TestFileSchema:
         def get_encoded_file():
             return 'base64encodedcontent'
 
-        rv_spec = client.get('/openapi.json')
-        content = rv_spec.json['paths']['/encoded-file']['get']['responses']['200']['content']
+        spec = app.spec
+        content = spec['paths']['/encoded-file']['get']['responses']['200']['content']
         assert 'application/octet-stream' in content
         assert content['application/octet-stream']['schema'] == {'type': 'string', 'format': 'base64'}
 
@@ -169,7 +166,7 @@ class TestFileSchema:
         f2 = FileSchema(type='string', format='base64')
         assert repr(f2) == 'schema: \n  type: string\n  format: base64'
 
-    def test_file_schema_multiple_endpoints(self, app: APIFlask, client):
+    def test_file_schema_multiple_endpoints(self, app: APIFlask):
         """Test FileSchema used in multiple endpoints with different content types"""
         file_schema = FileSchema()
 
@@ -183,9 +180,9 @@ class TestFileSchema:
         def download_zip():
             return send_file(io.BytesIO(b'ZIP'), mimetype='application/zip')
 
-        rv_spec = client.get('/openapi.json')
-        pdf_content = rv_spec.json['paths']['/download/pdf']['get']['responses']['200']['content']
-        zip_content = rv_spec.json['paths']['/download/zip']['get']['responses']['200']['content']
+        spec = app.spec
+        pdf_content = spec['paths']['/download/pdf']['get']['responses']['200']['content']
+        zip_content = spec['paths']['/download/zip']['get']['responses']['200']['content']
 
         assert 'application/pdf' in pdf_content
         assert 'application/zip' in zip_content
@@ -407,7 +404,7 @@ class TestSchemaConstants:
         assert properties['detail']['type'] == 'object'
         assert properties['message']['type'] == 'string'
 
-    def test_error_schemas_in_openapi(self, app: APIFlask, client):
+    def test_error_schemas_in_openapi(self, app: APIFlask, client, spec_validator):
         """Test that error schemas are properly included in OpenAPI spec"""
         @app.get('/test')
         @app.output(EmptySchema)
@@ -418,7 +415,7 @@ class TestSchemaConstants:
         assert rv.status_code == 200
 
         # Validate the complete OpenAPI spec
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
 
 
 class TestSchemaBaseClass:
@@ -560,7 +557,7 @@ class TestEdgeCases:
 class TestOpenAPISpecValidation:
     """Test that schemas generate valid OpenAPI specifications"""
 
-    def test_complete_openapi_spec_validation(self, app: APIFlask, client):
+    def test_complete_openapi_spec_validation(self, app: APIFlask, client, spec_validator):
         """Test that a complex API with various schemas generates valid OpenAPI spec"""
         # Create endpoints using different schemas
         @app.get('/empty')
@@ -593,7 +590,7 @@ class TestOpenAPISpecValidation:
         assert rv.status_code == 200
 
         # This will raise if the spec is invalid
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
 
         # Verify each endpoint is properly documented
         paths = rv.json['paths']
@@ -3,16 +3,15 @@ Comprehensive test suite for the security module in APIFlask
 Tests HTTPBasicAuth and HTTPTokenAuth classes with their custom features
 """
 
-import pytest
 import base64
 import time
-from flask import g, Flask
-from werkzeug.exceptions import Unauthorized, Forbidden
 
-from apiflask import APIFlask, APIBlueprint
+from apiflask import APIBlueprint
 from apiflask.security import HTTPBasicAuth, HTTPTokenAuth
 from apiflask.exceptions import HTTPError
 
+USER_AUTH_HEADERS = {'Authorization': 'Basic dXNlcjpwYXNz'}  # user:pass
+
 
 class TestHTTPBasicAuth:
     """Tests for HTTPBasicAuth class"""
@@ -322,8 +321,7 @@ class TestMultipleAuthMethods:
         client = app.test_client()
 
         # Test basic auth endpoint with basic credentials
-        rv = client.get('/basic-endpoint',
-                       headers={'Authorization': 'Basic dXNlcjpwYXNz'})
+        rv = client.get('/basic-endpoint', headers=USER_AUTH_HEADERS)
         assert rv.status_code == 200
         assert rv.json['auth']['auth_type'] == 'basic'
 
@@ -338,8 +336,7 @@ class TestMultipleAuthMethods:
                        headers={'Authorization': 'Bearer valid-token'})
         assert rv.status_code == 401
 
-        rv = client.get('/token-endpoint',
-                       headers={'Authorization': 'Basic dXNlcjpwYXNz'})
+        rv = client.get('/token-endpoint', headers=USER_AUTH_HEADERS)
         assert rv.status_code == 401
 
     def test_auth_isolation_between_instances(self, app):
@@ -508,8 +505,7 @@ class TestAuthErrorHandling:
         client = app.test_client()
 
         # Authenticate as regular user trying to access admin area
-        rv = client.get('/admin',
-                       headers={'Authorization': 'Basic dXNlcjpwYXNz'})  # user:pass
+        rv = client.get('/admin', headers=USER_AUTH_HEADERS)
 
         assert rv.status_code == 403  # Forbidden, not 401
         assert len(error_log) == 1
@@ -640,8 +636,7 @@ class TestAuthIntegration:
         assert rv.json['user'] is None
 
         # Test with auth - should return premium content
-        rv = client.get('/content',
-                       headers={'Authorization': 'Basic dXNlcjpwYXNz'})  # user:pass
+        rv = client.get('/content', headers=USER_AUTH_HEADERS)
         assert rv.status_code == 200
         assert rv.json['content'] == 'Premium content'
         assert rv.json['user']['username'] == 'user'
@@ -791,21 +786,20 @@ class TestEdgeCases:
         client = app.test_client()
 
         # Should fail since no verify callback is set
-        rv = client.get('/secure',
-                       headers={'Authorization': 'Basic dXNlcjpwYXNz'})
+        rv = client.get('/secure', headers=USER_AUTH_HEADERS)
         assert rv.status_code == 401
 
     def test_concurrent_requests_isolation(self, app):
         """Test that auth state is properly isolated between requests"""
         auth = HTTPTokenAuth()
+        users = {
+            'user1-token': {'id': 1, 'username': 'user1'},
+            'user2-token': {'id': 2, 'username': 'user2'},
+        }
 
         @auth.verify_token
         def verify_token(token):
-            if token == 'user1-token':
-                return {'id': 1, 'username': 'user1'}
-            elif token == 'user2-token':
-                return {'id': 2, 'username': 'user2'}
-            return None
+            return users.get(token)
 
         @app.route('/whoami')
         @auth.login_required
@@ -891,8 +885,7 @@ class TestPerformanceAndCaching:
         # Reset counter
         verification_count.clear()
 
-        rv = client.get('/test',
-                       headers={'Authorization': 'Basic dXNlcjpwYXNz'})
+        rv = client.get('/test', headers=USER_AUTH_HEADERS)
         assert rv.status_code == 200
         # Should only verify once despite multiple current_user accesses
         assert rv.json['verifications'] == 1
@@ -1,7 +1,6 @@
 import pytest
 import json
 
-import openapi_spec_validator as osv
 from flask.views import MethodView
 
 from apiflask import APIFlask
@@ -188,7 +187,7 @@ class TestSettingsApiDocs:
 
 class TestSettingsAutoBehaviour:
 
-    def test_auto_tags(self, app, client):
+    def test_auto_tags(self, app, client, spec_validator):
         bp = APIBlueprint('foo', __name__)
         app.config['AUTO_TAGS'] = False
 
@@ -199,22 +198,22 @@ class TestSettingsAutoBehaviour:
         app.register_blueprint(bp)
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['tags'] == []
         assert 'tags' not in rv.json['paths']['/']['get']
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_servers(self, app, client, config_value):
+    def test_auto_servers(self, app, client, config_value, spec_validator):
         app.config['AUTO_SERVERS'] = config_value
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert bool('servers' in rv.json) == config_value
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_path_summary(self, app, client, config_value):
+    def test_auto_path_summary(self, app, client, config_value, spec_validator):
         app.config['AUTO_OPERATION_SUMMARY'] = config_value
 
         @app.get('/foo')
@@ -249,7 +248,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         if config_value:
             assert rv.json['paths']['/foo']['get']['summary'] == 'Foo'
             assert rv.json['paths']['/bar']['get']['summary'] == 'Get Bar'
@@ -264,7 +263,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_path_summary_with_methodview(self, app, client, config_value):
+    def test_auto_path_summary_with_methodview(self, app, client, config_value, spec_validator):
         app.config['AUTO_OPERATION_SUMMARY'] = config_value
 
         @app.route('/foo')
@@ -293,7 +292,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         if config_value:
             assert rv.json['paths']['/foo']['get']['summary'] == 'Get Foo'
             assert rv.json['paths']['/foo']['post']['summary'] == 'Post Summary'
@@ -306,7 +305,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_path_description(self, app, client, config_value):
+    def test_auto_path_description(self, app, client, config_value, spec_validator):
         app.config['AUTO_OPERATION_DESCRIPTION'] = config_value
 
         @app.get('/foo')
@@ -345,7 +344,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         if config_value:
             assert rv.json['paths']['/foo']['get']['description'] == 'some description for foo'
             assert rv.json['paths']['/baz']['get']['description'] == 'some description for baz'
@@ -357,7 +356,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_200_response_for_bare_views(self, app, client, config_value):
+    def test_auto_200_response_for_bare_views(self, app, client, config_value, spec_validator):
         app.config['AUTO_200_RESPONSE'] = config_value
 
         @app.get('/foo')
@@ -383,7 +382,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert bool('/foo' in rv.json['paths']) is config_value
         assert bool('/bar' in rv.json['paths']) is config_value
         assert '/baz' in rv.json['paths']
@@ -392,7 +391,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_200_response_for_no_output_views(self, app, client, config_value):
+    def test_auto_200_response_for_no_output_views(self, app, client, config_value, spec_validator):
         app.config['AUTO_200_RESPONSE'] = config_value
 
         @app.get('/foo')
@@ -408,7 +407,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert '/foo' in rv.json['paths']
         assert '/bar' in rv.json['paths']
         assert bool('200' in rv.json['paths']['/foo']['get']['responses']) is config_value
@@ -416,7 +415,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_validation_error_response(self, app, client, config_value):
+    def test_auto_validation_error_response(self, app, client, config_value, spec_validator):
         app.config['AUTO_VALIDATION_ERROR_RESPONSE'] = config_value
 
         @app.post('/foo')
@@ -426,7 +425,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert bool('422' in rv.json['paths']['/foo']['post']['responses']) is config_value
         if config_value:
             assert 'ValidationError' in rv.json['components']['schemas']
@@ -439,7 +438,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_auth_error_response(self, app, client, config_value):
+    def test_auto_auth_error_response(self, app, client, config_value, spec_validator):
         app.config['AUTO_AUTH_ERROR_RESPONSE'] = config_value
         auth = HTTPBasicAuth()
 
@@ -450,7 +449,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert bool('401' in rv.json['paths']['/foo']['post']['responses']) is config_value
         if config_value:
             assert 'HTTPError' in rv.json['components']['schemas']
@@ -463,7 +462,9 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_blueprint_level_auto_auth_error_response(self, app, client, config_value):
+    def test_blueprint_level_auto_auth_error_response(
+        self, app, client, config_value, spec_validator
+    ):
         app.config['AUTO_AUTH_ERROR_RESPONSE'] = config_value
         bp = APIBlueprint('auth', __name__)
         no_auth_bp = APIBlueprint('no-auth', __name__)
@@ -492,7 +493,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
 
         assert 'auth' in app._auth_blueprints
         assert 'no-auth' not in app._auth_blueprints
@@ -517,7 +518,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_404_error(self, app, client, config_value):
+    def test_auto_404_error(self, app, client, config_value, spec_validator):
         app.config['AUTO_404_RESPONSE'] = config_value
 
         @app.get('/foo/<int:id>')
@@ -526,7 +527,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert bool('404' in rv.json['paths']['/foo/{id}']['get']['responses']) is config_value
         if config_value:
             assert 'HTTPError' in rv.json['components']['schemas']
@@ -539,7 +540,7 @@ class TestSettingsAutoBehaviour:
 
 
     @pytest.mark.parametrize('config_value', [True, False])
-    def test_auto_operationid(self, app, client, config_value):
+    def test_auto_operationid(self, app, client, config_value, spec_validator):
         app.config['AUTO_OPERATION_ID'] = config_value
 
         @app.get('/foo')
@@ -560,7 +561,7 @@ class TestSettingsAutoBehaviour:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert bool('operationId' in rv.json['paths']['/foo']['get']) == config_value
         assert bool('operationId' in rv.json['paths']['/test/foo']['get']) == config_value
         if config_value:
@@ -570,7 +571,7 @@ class TestSettingsAutoBehaviour:
 
 class TestSettingsOpenApiFields:
 
-    def test_openapi_fields(self, app, client):
+    def test_openapi_fields(self, app, client, spec_validator):
         openapi_version = '3.0.2'
         description = 'My API'
         tags = [
@@ -607,7 +608,7 @@ class TestSettingsOpenApiFields:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['openapi'] == openapi_version
         assert rv.json['tags'] == tags
         assert rv.json['servers'] == servers
@@ -618,7 +619,7 @@ class TestSettingsOpenApiFields:
         assert rv.json['info']['termsOfService'] == terms_of_service
 
 
-    def test_info(self, app, client):
+    def test_info(self, app, client, spec_validator):
         app.config['INFO'] = {
             'description': 'My API',
             'termsOfService': 'http://example.com',
@@ -632,14 +633,14 @@ class TestSettingsOpenApiFields:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['info']['description'] == app.config['INFO']['description']
         assert rv.json['info']['termsOfService'] == app.config['INFO']['termsOfService']
         assert rv.json['info']['contact'] == app.config['INFO']['contact']
         assert rv.json['info']['license'] == app.config['INFO']['license']
 
 
-    def test_overwrite_info(self, app, client):
+    def test_overwrite_info(self, app, client, spec_validator):
         app.config['INFO'] = {
             'description': 'Not set',
             'termsOfService': 'Not set',
@@ -661,14 +662,14 @@ class TestSettingsOpenApiFields:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['info']['description'] == app.config['DESCRIPTION']
         assert rv.json['info']['termsOfService'] == app.config['TERMS_OF_SERVICE']
         assert rv.json['info']['contact'] == app.config['CONTACT']
         assert rv.json['info']['license'] == app.config['LICENSE']
 
 
-    def test_security_schemes(self, app, client):
+    def test_security_schemes(self, app, client, spec_validator):
         app.config['SECURITY_SCHEMES'] = {
             'ApiKeyAuth': {'type': 'apiKey', 'in': 'header', 'name': 'X-API-Key'},
             'BasicAuth': {
@@ -679,7 +680,7 @@ class TestSettingsOpenApiFields:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert len(rv.json['components']['securitySchemes']) == 2
         assert (
             rv.json['components']['securitySchemes']['ApiKeyAuth']
@@ -743,8 +744,7 @@ class TestSettingsOpenApiSpec:
 
         result = cli_runner.invoke(spec_command)
         assert 'openapi' in result.output
-        with open(local_spec_path) as f:
-            assert json.loads(f.read()) == app.spec
+        assert json.loads(local_spec_path.read_text()) == app.spec
 
 
     @pytest.mark.parametrize('indent', [0, 2, 4])
@@ -759,7 +759,7 @@ class TestSettingsOpenApiSpec:
 
 class TestSettingsResponseCustomization:
 
-    def test_response_description_config(self, app, client):
+    def test_response_description_config(self, app, client, spec_validator):
         app.config['SUCCESS_DESCRIPTION'] = 'Success'
         app.config['NOT_FOUND_DESCRIPTION'] = 'Egg not found'
 
@@ -789,7 +789,7 @@ class TestSettingsResponseCustomization:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/foo']['get']['responses']['200']['description'] == 'Success'
         assert rv.json['paths']['/bar']['get']['responses']['201']['description'] == 'Success'
         assert rv.json['paths']['/baz']['get']['responses']['200']['description'] == 'Success'
@@ -799,7 +799,7 @@ class TestSettingsResponseCustomization:
         )
 
 
-    def test_validation_error_status_code_and_description(self, app, client):
+    def test_validation_error_status_code_and_description(self, app, client, spec_validator):
         app.config['VALIDATION_ERROR_STATUS_CODE'] = 400
         app.config['VALIDATION_ERROR_DESCRIPTION'] = 'Bad'
 
@@ -810,13 +810,14 @@ class TestSettingsResponseCustomization:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
-        assert rv.json['paths']['/foo']['post']['responses']['400'] is not None
-        assert rv.json['paths']['/foo']['post']['responses']['400']['description'] == 'Bad'
+        spec_validator(rv.json).validate()
+        response = rv.json['paths']['/foo']['post']['responses']['400']
+        assert response is not None
+        assert response['description'] == 'Bad'
 
 
     @pytest.mark.parametrize('schema', [http_error_schema, ValidationError])
-    def test_validation_error_schema(self, app, client, schema):
+    def test_validation_error_schema(self, app, client, schema, spec_validator):
         app.config['VALIDATION_ERROR_SCHEMA'] = schema
 
         @app.post('/foo')
@@ -826,9 +827,10 @@ class TestSettingsResponseCustomization:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
-        assert rv.json['paths']['/foo']['post']['responses']['422']
-        assert rv.json['paths']['/foo']['post']['responses']['422']['description'] == 'Validation error'
+        spec_validator(rv.json).validate()
+        response = rv.json['paths']['/foo']['post']['responses']['422']
+        assert response
+        assert response['description'] == 'Validation error'
         assert 'ValidationError' in rv.json['components']['schemas']
 
 
@@ -844,7 +846,7 @@ class TestSettingsResponseCustomization:
             app.spec
 
 
-    def test_auth_error_status_code_and_description(self, app, client):
+    def test_auth_error_status_code_and_description(self, app, client, spec_validator):
         app.config['AUTH_ERROR_STATUS_CODE'] = 403
         app.config['AUTH_ERROR_DESCRIPTION'] = 'Bad'
         auth = HTTPBasicAuth()
@@ -856,12 +858,13 @@ class TestSettingsResponseCustomization:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
-        assert rv.json['paths']['/foo']['post']['responses']['403'] is not None
-        assert rv.json['paths']['/foo']['post']['responses']['403']['description'] == 'Bad'
+        spec_validator(rv.json).validate()
+        response = rv.json['paths']['/foo']['post']['responses']['403']
+        assert response is not None
+        assert response['description'] == 'Bad'
 
 
-    def test_auth_error_schema(self, app, client):
+    def test_auth_error_schema(self, app, client, spec_validator):
         auth = HTTPBasicAuth()
 
         @app.post('/foo')
@@ -871,12 +874,12 @@ class TestSettingsResponseCustomization:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/foo']['post']['responses']['401']
         assert 'HTTPError' in rv.json['components']['schemas']
 
 
-    def test_http_auth_error_response(self, app, client):
+    def test_http_auth_error_response(self, app, client, spec_validator):
         @app.get('/foo')
         @app.output(Foo)
         @app.doc(responses={204: 'empty', 400: 'bad', 404: 'not found', 500: 'server error'})
@@ -885,7 +888,7 @@ class TestSettingsResponseCustomization:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert 'HTTPError' in rv.json['components']['schemas']
         assert (
             '#/components/schemas/HTTPError'
@@ -903,7 +906,7 @@ class TestSettingsResponseCustomization:
 
 
     @pytest.mark.parametrize('schema', [http_error_schema, HTTPError])
-    def test_http_error_schema(self, app, client, schema):
+    def test_http_error_schema(self, app, client, schema, spec_validator):
         app.config['HTTP_ERROR_SCHEMA'] = schema
 
         @app.get('/foo')
@@ -914,7 +917,7 @@ class TestSettingsResponseCustomization:
 
         rv = client.get('/openapi.json')
         assert rv.status_code == 200
-        osv.validate(rv.json)
+        spec_validator(rv.json).validate()
         assert rv.json['paths']['/foo']['get']['responses']['404']
         assert 'HTTPError' in rv.json['components']['schemas']
 